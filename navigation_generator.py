@@ -220,7 +220,8 @@ class NavigationGenerator:
 
 def main():
     """Main function to generate navigation data"""
-    generator = NavigationGenerator()
+    # Scan the checkout this script lives in, wherever it is run from (cron, CI)
+    generator = NavigationGenerator(base_path=Path(__file__).parent)
     
     print("🔍 HowManyQ Navigation Generator")
     print("=" * 50)
@@ -4,6 +4,8 @@
 PROJECT_DIR="/Users/zhaochen/Desktop/2025/11/v2/howmanyq"
 LOG_FILE="$PROJECT_DIR/cron.log"
 PYTHON_SCRIPT="$PROJECT_DIR/navigation_generator.py"
+RELATED_SCRIPT="$PROJECT_DIR/related_tools_generator.py"
+PRECACHE_SCRIPT="$PROJECT_DIR/precache_generator.py"
 
 # 创建日志目录
 mkdir -p "$(dirname "$LOG_FILE")"
@@ -23,12 +25,26 @@ fi
 if /usr/bin/python3 "$PYTHON_SCRIPT" >> "$LOG_FILE" 2>&1; then
     echo "✅ 导航数据更新成功: $(date)" >> "$LOG_FILE"
     
+    # 更新相关工具图并改写受影响的页面（须在预缓存之前）
+    if /usr/bin/python3 "$RELATED_SCRIPT" >> "$LOG_FILE" 2>&1; then
+        echo "✅ 相关工具图更新成功: $(date)" >> "$LOG_FILE"
+    else
+        echo "❌ 相关工具图更新失败: $(date)" >> "$LOG_FILE"
+    fi
+    
+    # 重新生成预缓存清单与 Service Worker（页面变更后必须更新哈希）
+    if /usr/bin/python3 "$PRECACHE_SCRIPT" >> "$LOG_FILE" 2>&1; then
+        echo "✅ 预缓存清单更新成功: $(date)" >> "$LOG_FILE"
+    else
+        echo "❌ 预缓存清单更新失败: $(date)" >> "$LOG_FILE"
+    fi
+    
     # 检查是否有实际变更
-    if git -C "$PROJECT_DIR" diff --quiet HEAD -- navigation_data.json; then
+    if git -C "$PROJECT_DIR" diff --quiet HEAD -- navigation_data.json related_tools.json precache-manifest.json sw.js index.html '*/index.html'; then
         echo "ℹ️  无数据变更" >> "$LOG_FILE"
     else
         echo "📊 数据已更新，准备提交" >> "$LOG_FILE"
-        git -C "$PROJECT_DIR" add navigation_data.json
+        git -C "$PROJECT_DIR" add navigation_data.json related_tools.json precache-manifest.json sw.js index.html '*/index.html'
         git -C "$PROJECT_DIR" commit -m "🤖 Auto-update navigation data - $(date +'%Y-%m-%d %H:%M')" || echo "提交失败或无变更" >> "$LOG_FILE"
     fi
 else
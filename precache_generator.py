@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+"""
+HowManyQ Precache Manifest Generator
+Builds a versioned precache manifest from navigation_data.json and a service
+worker that keeps the site shell and popular tools available offline.
+- Every tool page and shared asset is listed with a content hash
+- Cache entries are keyed by hash, so a deploy only refetches changed files
+- Pages are served network-first; the cache only answers offline visits
+- Registers the service worker on the homepage and every tool page
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).parent
+MANIFEST_FILE = "precache-manifest.json"
+SERVICE_WORKER_FILE = "sw.js"
+CACHE_NAME = "howmanyq-precache"
+
+# Site shell: always precached so the homepage works offline
+SHELL_ASSETS = ["index.html", "navigation_data.json", "share-utils.js"]
+
+# Tool pages precached on install; the rest are cached on first visit
+POPULAR_TOOLS = [
+    "how_many_days_until_christmas",
+    "how_many_days_until_halloween",
+    "how_many_cups_in_a_quart",
+    "how_many_ounces_in_a_gallon",
+    "how_many_tablespoons_in_a_cup",
+    "how_many_grams_in_an_ounce",
+    "how_many_weeks_in_a_year",
+    "how_many_people_are_in_the_world",
+]
+
+# Files inside a tool folder that the page loads at runtime
+TOOL_ASSET_SUFFIXES = {".js", ".json", ".css"}
+
+SW_MARKER = "<!-- HowManyQ service worker -->"
+SW_REGISTRATION_SNIPPET = f"""    {SW_MARKER}
+    <script>
+      if ('serviceWorker' in navigator) {{
+        window.addEventListener('load', function () {{
+          navigator.serviceWorker.register('/{SERVICE_WORKER_FILE}');
+        }});
+      }}
+    </script>"""
+
+SERVICE_WORKER_TEMPLATE = """// HowManyQ service worker
+// Generated by precache_generator.py - do not edit by hand.
+const CACHE_NAME = '__CACHE_NAME__';
+const MANIFEST_VERSION = '__MANIFEST_VERSION__';
+const MANIFEST = __MANIFEST_ENTRIES__;
+
+const REVISIONS = new Map(MANIFEST.map((entry) => [entry.url, entry.revision]));
+
+function normalizePath(pathname) {
+  if (pathname.endsWith('/index.html')) {
+    return pathname.slice(0, -'index.html'.length);
+  }
+  return pathname;
+}
+
+// Entries are stored under a hash-qualified key, so unchanged files survive
+// a deploy and changed files simply miss the cache.
+function cacheKey(path) {
+  return path + '?__rev=' + REVISIONS.get(path);
+}
+
+function fetchFresh(path) {
+  return fetch(new Request(path, { cache: 'no-cache' }));
+}
+
+// Assets are immutable under their hash-qualified key.
+async function cacheFirst(cache, path) {
+  const key = cacheKey(path);
+  const cached = await cache.match(key);
+  if (cached) {
+    return cached;
+  }
+  const response = await fetchFresh(path);
+  if (response.ok) {
+    await cache.put(key, response.clone());
+  }
+  return response;
+}
+
+// Pages always try the network, so an edit shipped without regenerating
+// this file is still seen; the cache only covers offline visits.
+async function networkFirst(cache, path) {
+  const key = cacheKey(path);
+  try {
+    const response = await fetchFresh(path);
+    if (response.ok) {
+      await cache.put(key, response.clone());
+      return response;
+    }
+    return (await cache.match(key)) || response;
+  } catch (error) {
+    const cached = await cache.match(key);
+    if (cached) {
+      return cached;
+    }
+    // Send uncached pages to the homepage rather than serving its body
+    // under another URL, where its relative links would break
+    if (path !== '/' && (await cache.match(cacheKey('/')))) {
+      return Response.redirect('/', 302);
+    }
+    throw error;
+  }
+}
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    caches.open(CACHE_NAME).then((cache) =>
+      Promise.all(
+        MANIFEST.filter((entry) => entry.precache).map(async (entry) => {
+          const key = cacheKey(entry.url);
+          if (await cache.match(key)) {
+            return;
+          }
+          const response = await fetchFresh(entry.url);
+          if (response.ok) {
+            await cache.put(key, response);
+          }
+        })
+      )
+    ).then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  const currentKeys = new Set(
+    MANIFEST.map((entry) => new URL(cacheKey(entry.url), self.location.origin).href)
+  );
+  event.waitUntil(
+    caches.keys()
+      .then((names) =>
+        Promise.all(
+          names
+            .filter((name) => name.startsWith('howmanyq-') && name !== CACHE_NAME)
+            .map((name) => caches.delete(name))
+        )
+      )
+      .then(() => caches.open(CACHE_NAME))
+      .then((cache) =>
+        cache.keys().then((requests) =>
+          Promise.all(
+            requests
+              .filter((request) => !currentKeys.has(request.url))
+              .map((request) => cache.delete(request))
+          )
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) {
+    return;
+  }
+  const path = normalizePath(url.pathname);
+  if (!REVISIONS.has(path)) {
+    return;
+  }
+
+  event.respondWith(
+    caches.open(CACHE_NAME).then((cache) =>
+      request.mode === 'navigate' ? networkFirst(cache, path) : cacheFirst(cache, path)
+    )
+  );
+});
+"""
+
+
+def content_hash(path: Path) -> str:
+    """Short, stable hash of a file's bytes used as its cache revision."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()[:16]
+
+
+def site_path(path: Path) -> str:
+    """Map a file under ROOT to the URL path it is served from."""
+    relative = path.relative_to(ROOT).as_posix()
+    if relative == "index.html":
+        return "/"
+    if relative.endswith("/index.html"):
+        return "/" + relative[: -len("index.html")]
+    return "/" + relative
+
+
+def inject_sw_registration(html: str) -> Tuple[str, bool]:
+    """Insert the service worker registration snippet before </body>."""
+    if SW_MARKER in html:
+        return html, False
+
+    body_match = re.search(r"</body>", html, re.IGNORECASE)
+    if not body_match:
+        return html, False
+
+    updated = html[: body_match.start()] + SW_REGISTRATION_SNIPPET + "\n" + html[body_match.start() :]
+    return updated, True
+
+
+def register_service_worker(pages: List[Path]) -> List[Path]:
+    """Add the registration snippet to every page that is missing it."""
+    updated = []
+    for page in pages:
+        original = page.read_text(encoding="utf-8")
+        new_content, changed = inject_sw_registration(original)
+        if changed:
+            page.write_text(new_content, encoding="utf-8")
+            updated.append(page)
+    return updated
+
+
+def collect_entries(nav_data: Dict) -> List[Dict]:
+    """Build manifest entries for the shell, every tool page and its assets."""
+    files = []
+    for name in SHELL_ASSETS:
+        files.append((ROOT / name, True))
+
+    popular = set(POPULAR_TOOLS)
+    for tool in nav_data.get("tools", []):
+        folder = ROOT / tool["folder_name"]
+        index_file = folder / "index.html"
+        if not index_file.is_file():
+            continue
+        precache = tool["folder_name"] in popular
+        files.append((index_file, precache))
+        for asset in sorted(folder.iterdir()):
+            if asset.is_file() and asset.suffix in TOOL_ASSET_SUFFIXES:
+                files.append((asset, precache))
+
+    entries = []
+    for path, precache in files:
+        if not path.is_file():
+            print(f"⚠️  Warning: {path.relative_to(ROOT)} not found, skipping")
+            continue
+        entries.append({
+            "url": site_path(path),
+            "revision": content_hash(path),
+            "precache": precache,
+        })
+
+    entries.sort(key=lambda entry: entry["url"])
+    return entries
+
+
+def manifest_version(entries: List[Dict]) -> str:
+    """Version derived from all revisions, so it only moves when content does."""
+    digest = hashlib.sha256()
+    for entry in entries:
+        digest.update(f"{entry['url']}:{entry['revision']}\n".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def render_service_worker(version: str, entries: List[Dict]) -> str:
+    """Fill the service worker template with the current manifest."""
+    return (
+        SERVICE_WORKER_TEMPLATE
+        .replace("__CACHE_NAME__", CACHE_NAME)
+        .replace("__MANIFEST_VERSION__", version)
+        .replace("__MANIFEST_ENTRIES__", json.dumps(entries, indent=2))
+    )
+
+
+def generate_precache():
+    """Generate precache-manifest.json and sw.js for the HowManyQ site"""
+    nav_file = ROOT / "navigation_data.json"
+    if not nav_file.exists():
+        print("❌ Error: navigation_data.json not found!")
+        return None
+
+    with open(nav_file, "r", encoding="utf-8") as f:
+        nav_data = json.load(f)
+
+    # Pages must carry the registration snippet before they are hashed
+    pages = [ROOT / "index.html"]
+    pages += [ROOT / tool["folder_name"] / "index.html" for tool in nav_data.get("tools", [])]
+    registered = register_service_worker([page for page in pages if page.is_file()])
+
+    entries = collect_entries(nav_data)
+    version = manifest_version(entries)
+
+    manifest = {
+        "version": version,
+        "cache_name": CACHE_NAME,
+        "entries": entries,
+    }
+    with open(ROOT / MANIFEST_FILE, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+    with open(ROOT / SERVICE_WORKER_FILE, "w", encoding="utf-8") as f:
+        f.write(render_service_worker(version, entries))
+
+    return manifest, registered
+
+
+def main():
+    """Main function"""
+    print("🔍 HowManyQ Precache Generator")
+    print("=" * 50)
+
+    result = generate_precache()
+
+    if result:
+        manifest, registered = result
+        entries = manifest["entries"]
+        precached = sum(1 for entry in entries if entry["precache"])
+        print(f"✅ Precache manifest generated successfully!")
+        print(f"📁 Output files: {MANIFEST_FILE}, {SERVICE_WORKER_FILE}")
+        print(f"🔖 Manifest version: {manifest['version']}")
+        print(f"🔢 Total entries: {len(entries)} ({precached} precached on install)")
+        if registered:
+            print(f"🔄 Registered service worker in {len(registered)} page(s):")
+            for page in registered:
+                print(f"  + {page.relative_to(ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
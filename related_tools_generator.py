@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+HowManyQ Related Tools Generator
+Builds a related-tools graph from navigation_data.json and injects a
+"Related tools" block plus <link rel="prefetch"> hints into every tool page.
+- Neighbours are scored by category, shared units and conversion chains
+- Scores are cached in related_tools.json; only new or changed tools are
+  rescored, and only pages whose block is out of date are rewritten
+"""
+
+import hashlib
+import html
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from navigation_generator import NavigationGenerator
+from precache_generator import POPULAR_TOOLS, SW_MARKER
+
+ROOT = Path(__file__).parent
+GRAPH_FILE = "related_tools.json"
+
+RELATED_LIMIT = 4
+PREFETCH_LIMIT = 2
+
+SAME_CATEGORY_SCORE = 1
+SHARED_UNIT_SCORE = 2
+CHAINED_CONVERSION_SCORE = 3
+INVERSE_CONVERSION_SCORE = 5
+
+# Folder-name spellings mapped to one canonical unit
+UNIT_ALIASES = {
+    'cup': 'cup', 'cups': 'cup',
+    'pint': 'pint', 'pints': 'pint',
+    'quart': 'quart', 'quarts': 'quart',
+    'gallon': 'gallon', 'gallons': 'gallon',
+    'liter': 'liter', 'liters': 'liter', 'ml': 'milliliter',
+    'tbsp': 'tablespoon', 'tablespoon': 'tablespoon', 'tablespoons': 'tablespoon',
+    'tsp': 'teaspoon', 'teaspoon': 'teaspoon', 'teaspoons': 'teaspoon',
+    'oz': 'ounce', 'ounce': 'ounce', 'ounces': 'ounce',
+    'gram': 'gram', 'grams': 'gram',
+    'pound': 'pound', 'pounds': 'pound',
+    'kilogram': 'kilogram', 'kilograms': 'kilogram',
+    'calorie': 'calorie', 'calories': 'calorie',
+    'cm': 'centimeter', 'centimeter': 'centimeter', 'centimeters': 'centimeter',
+    'inch': 'inch', 'inches': 'inch',
+    'foot': 'foot', 'feet': 'foot',
+    'yard': 'yard', 'yards': 'yard',
+    'mile': 'mile', 'miles': 'mile',
+    'acre': 'acre', 'acres': 'acre',
+    'step': 'step', 'steps': 'step',
+    'second': 'second', 'seconds': 'second',
+    'minute': 'minute', 'minutes': 'minute',
+    'hour': 'hour', 'hours': 'hour',
+    'day': 'day', 'days': 'day',
+    'week': 'week', 'weeks': 'week',
+    'month': 'month', 'months': 'month',
+    'year': 'year', 'years': 'year',
+}
+
+# "how_many_<from>_in_a_<to>" / "how_many_<from>_is_10000_<to>"
+CONVERSION_PATTERN = re.compile(r'^how_many_(?P<source>[a-z_]+?)_(?:in|is)_(?:(?:a|an|\d+)_)?(?P<target>[a-z0-9]+)$')
+
+RELATED_START = "<!-- HowManyQ related tools -->"
+RELATED_END = "<!-- End HowManyQ related tools -->"
+PREFETCH_START = "<!-- HowManyQ prefetch hints -->"
+PREFETCH_END = "<!-- End HowManyQ prefetch hints -->"
+
+
+def tool_features(generator: NavigationGenerator, tool: Dict) -> Dict:
+    """Pre-compute everything the pairwise scoring needs for one tool."""
+    folder_name = tool['folder_name']
+    keywords = generator.extract_keywords_from_folder(folder_name)
+    category = generator.determine_category(folder_name, keywords)
+
+    # determine_category falls back to the first category when nothing
+    # matches, which is not a real signal for relatedness
+    if not any(keyword in generator.category_mapping[category] for keyword in keywords):
+        category = None
+
+    # Only the units a conversion is between count, so phrases like
+    # "calories should I eat a day" do not share a "day" unit
+    units = set()
+    conversion = None
+    match = CONVERSION_PATTERN.match(folder_name)
+    if match:
+        source = UNIT_ALIASES.get(match.group('source').split('_')[-1])
+        target = UNIT_ALIASES.get(match.group('target'))
+        units = {unit for unit in (source, target) if unit}
+        if source and target and source != target:
+            conversion = (source, target)
+
+    return {
+        'folder_name': folder_name,
+        'title': tool['title'],
+        'icon': generator.icon_mapping.get(category, '🧮'),
+        'category': category,
+        'units': units,
+        'conversion': conversion,
+    }
+
+
+def relatedness_score(a: Dict, b: Dict) -> int:
+    """Score how closely two tools are related; 0 means unrelated."""
+    score = 0
+    if a['category'] and a['category'] == b['category']:
+        score += SAME_CATEGORY_SCORE
+
+    score += SHARED_UNIT_SCORE * len(a['units'] & b['units'])
+
+    if a['conversion'] and b['conversion']:
+        a_source, a_target = a['conversion']
+        b_source, b_target = b['conversion']
+        if a_source == b_target and a_target == b_source:
+            score += INVERSE_CONVERSION_SCORE
+        elif a_target == b_source or a_source == b_target:
+            # e.g. cups in a quart -> quarts in a gallon
+            score += CHAINED_CONVERSION_SCORE
+
+    return score
+
+
+def scoring_signature() -> str:
+    """Fingerprint of the scoring weights; cached scores are void when it moves."""
+    weights = [SAME_CATEGORY_SCORE, SHARED_UNIT_SCORE, CHAINED_CONVERSION_SCORE, INVERSE_CONVERSION_SCORE]
+    return hashlib.sha256(json.dumps(weights).encode('utf-8')).hexdigest()[:12]
+
+
+def scoring_record(feature: Dict) -> Dict:
+    """JSON form of the features that feed relatedness_score."""
+    return {
+        'category': feature['category'],
+        'units': sorted(feature['units']),
+        'conversion': list(feature['conversion']) if feature['conversion'] else None,
+    }
+
+
+def score_tools(features: List[Dict], cache: Dict) -> Tuple[Dict[str, Dict[str, int]], List[str]]:
+    """Pairwise scores, recomputing only the rows of new or changed tools."""
+    current = {feature['folder_name'] for feature in features}
+    cached_records = cache.get('features', {})
+
+    if cache.get('scoring') == scoring_signature():
+        # Removed tools drop out of every row
+        scores = {
+            folder_name: {neighbour: score for neighbour, score in row.items() if neighbour in current}
+            for folder_name, row in cache.get('scores', {}).items()
+            if folder_name in current
+        }
+    else:
+        scores = {}
+
+    changed = [
+        feature for feature in features
+        if feature['folder_name'] not in scores
+        or cached_records.get(feature['folder_name']) != scoring_record(feature)
+    ]
+    for feature in features:
+        scores.setdefault(feature['folder_name'], {})
+
+    for a in changed:
+        a_name = a['folder_name']
+        scores[a_name] = {}
+        for b in features:
+            b_name = b['folder_name']
+            if b_name == a_name:
+                continue
+            score = relatedness_score(a, b)
+            if score > 0:
+                scores[a_name][b_name] = score
+                scores[b_name][a_name] = score
+            else:
+                scores[b_name].pop(a_name, None)
+
+    return scores, [feature['folder_name'] for feature in changed]
+
+
+def build_graph(features: List[Dict], scores: Dict[str, Dict[str, int]]) -> Dict[str, List[Dict]]:
+    """Rank every tool's neighbours from the pairwise scores."""
+    by_folder = {feature['folder_name']: feature for feature in features}
+
+    graph = {}
+    for feature in features:
+        folder_name = feature['folder_name']
+        ranked = sorted(scores[folder_name].items(), key=lambda item: (-item[1], by_folder[item[0]]['title']))
+        neighbours = ranked[:RELATED_LIMIT]
+
+        # Tools with no related neighbours link to popular tools instead
+        if not neighbours:
+            neighbours = [
+                (popular, 0) for popular in POPULAR_TOOLS
+                if popular in by_folder and popular != folder_name
+            ][:RELATED_LIMIT]
+
+        graph[folder_name] = [
+            {
+                'folder_name': neighbour,
+                'title': by_folder[neighbour]['title'],
+                'icon': by_folder[neighbour]['icon'],
+                'score': score,
+            }
+            for neighbour, score in neighbours
+        ]
+
+    return graph
+
+
+def load_cache(graph_path: Path) -> Dict:
+    """Load the previously generated graph, or an empty one."""
+    if not graph_path.exists():
+        return {}
+    try:
+        with open(graph_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Warning: Could not read {graph_path.name}, rebuilding: {e}")
+        return {}
+
+
+def render_related_block(related: List[Dict]) -> str:
+    """Render the "Related tools" section for a page."""
+    items = '\n'.join(
+        f'            <li><a href="/{neighbour["folder_name"]}/" style="display: inline-block; padding: 8px 14px; border: 1px solid rgba(128,128,128,0.4); border-radius: 8px; color: inherit; text-decoration: none;">'
+        f'{neighbour["icon"]} {html.escape(neighbour["title"])}</a></li>'
+        for neighbour in related
+    )
+    return f'''    {RELATED_START}
+    <section class="related-tools" style="max-width: 960px; margin: 40px auto; padding: 0 20px; font-family: sans-serif;">
+        <h2 style="font-size: 18px; margin-bottom: 12px;">Related tools</h2>
+        <ul style="list-style: none; padding: 0; margin: 0; display: flex; flex-wrap: wrap; gap: 10px;">
+{items}
+        </ul>
+    </section>
+    {RELATED_END}'''
+
+
+def render_prefetch_hints(related: List[Dict]) -> str:
+    """Render <link rel="prefetch"> hints for the top related neighbours."""
+    # Popular-tool fallbacks (score 0) are not likely next pages
+    prefetched = [neighbour for neighbour in related if neighbour['score'] > 0][:PREFETCH_LIMIT]
+    lines = [f'    {PREFETCH_START}']
+    lines += [f'    <link rel="prefetch" href="/{neighbour["folder_name"]}/" />' for neighbour in prefetched]
+    lines.append(f'    {PREFETCH_END}')
+    return '\n'.join(lines)
+
+
+def replace_or_insert(content: str, start: str, end: str, block: str, anchors: List[str]) -> Optional[str]:
+    """Replace the marked block, or insert it before the first anchor found."""
+    existing = re.compile(r'[ \t]*' + re.escape(start) + r'.*?' + re.escape(end), re.DOTALL)
+    if existing.search(content):
+        return existing.sub(lambda _: block, content, count=1)
+
+    for anchor in anchors:
+        position = content.find(anchor)
+        if position != -1:
+            # Keep the anchor's indentation on its own line
+            line_start = content.rfind('\n', 0, position) + 1
+            if not content[line_start:position].strip():
+                position = line_start
+            return content[:position] + block + '\n' + content[position:]
+    return None
+
+
+def page_is_current(content: str, related: List[Dict]) -> bool:
+    """Check that the page already ships the block and hints for this neighbour list."""
+    return render_related_block(related) in content and render_prefetch_hints(related) in content
+
+
+def inject_related_tools(content: str, related: List[Dict]) -> Tuple[str, bool]:
+    """Inject the related block and prefetch hints into a page."""
+    updated = replace_or_insert(content, RELATED_START, RELATED_END, render_related_block(related), [SW_MARKER, '</body>'])
+    if updated is None:
+        return content, False
+
+    with_hints = replace_or_insert(updated, PREFETCH_START, PREFETCH_END, render_prefetch_hints(related), ['</head>'])
+    if with_hints is None:
+        return content, False
+
+    return with_hints, with_hints != content
+
+
+def generate_related_tools():
+    """Build the related-tools graph and rewrite affected tool pages"""
+    nav_file = ROOT / "navigation_data.json"
+    if not nav_file.exists():
+        print("❌ Error: navigation_data.json not found!")
+        return None
+
+    with open(nav_file, 'r', encoding='utf-8') as f:
+        nav_data = json.load(f)
+
+    tools = [
+        tool for tool in nav_data.get('tools', [])
+        if (ROOT / tool['folder_name'] / 'index.html').is_file()
+    ]
+
+    generator = NavigationGenerator(base_path=ROOT)
+    features = [tool_features(generator, tool) for tool in tools]
+
+    graph_path = ROOT / GRAPH_FILE
+    cache = load_cache(graph_path)
+    scores, rescored = score_tools(features, cache)
+    graph = build_graph(features, scores)
+
+    # Tools whose neighbour list differs from the cached graph
+    cached_graph = cache.get('tools', {})
+    affected = [folder_name for folder_name, related in graph.items() if cached_graph.get(folder_name) != related]
+
+    rewritten = []
+    for folder_name, related in graph.items():
+        if not related:
+            continue
+        page = ROOT / folder_name / 'index.html'
+        content = page.read_text(encoding='utf-8')
+        # Unaffected pages are still checked, so a page whose rewrite was
+        # never committed is repaired on the next run
+        if page_is_current(content, related):
+            continue
+        new_content, changed = inject_related_tools(content, related)
+        if changed:
+            page.write_text(new_content, encoding='utf-8')
+            rewritten.append(page)
+
+    version = hashlib.sha256(json.dumps(graph, sort_keys=True).encode('utf-8')).hexdigest()[:12]
+    with open(graph_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': version,
+            'scoring': scoring_signature(),
+            'features': {feature['folder_name']: scoring_record(feature) for feature in features},
+            'scores': {folder_name: dict(sorted(row.items())) for folder_name, row in scores.items()},
+            'tools': graph,
+        }, f, indent=2, ensure_ascii=False)
+        f.write('\n')
+
+    return graph, rescored, affected, rewritten
+
+
+def main():
+    """Main function"""
+    print("🔍 HowManyQ Related Tools Generator")
+    print("=" * 50)
+
+    result = generate_related_tools()
+
+    if result:
+        graph, rescored, affected, rewritten = result
+        edges = sum(len(related) for related in graph.values())
+        print(f"✅ Related tools graph generated successfully!")
+        print(f"📁 Output file: {GRAPH_FILE}")
+        print(f"🔢 Tools: {len(graph)}, links: {edges}")
+        print(f"🧮 Rescored {len(rescored)} tool(s); neighbours changed for {len(affected)}")
+        if rewritten:
+            print(f"🔄 Rewrote {len(rewritten)} page(s):")
+            for page in rewritten:
+                print(f"  + {page.relative_to(ROOT)}")
+        else:
+            print("ℹ️  No pages needed updating")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,8 @@
 PROJECT_DIR="/Users/zhaochen/Desktop/2025/11/v2/howmanyq"
 LOG_FILE="$PROJECT_DIR/cron_smart.log"
 PYTHON_SCRIPT="$PROJECT_DIR/navigation_generator.py"
+RELATED_SCRIPT="$PROJECT_DIR/related_tools_generator.py"
+PRECACHE_SCRIPT="$PROJECT_DIR/precache_generator.py"
 
 cd "$PROJECT_DIR" || exit 1
 
@@ -20,9 +22,23 @@ if [ "$NEW_FILES" -gt 0 ]; then
     if /usr/bin/python3 "$PYTHON_SCRIPT" >> "$LOG_FILE" 2>&1; then
         echo "✅ 导航数据更新成功" >> "$LOG_FILE"
         
+        # 更新相关工具图并改写受影响的页面（须在预缓存之前）
+        if /usr/bin/python3 "$RELATED_SCRIPT" >> "$LOG_FILE" 2>&1; then
+            echo "✅ 相关工具图更新成功" >> "$LOG_FILE"
+        else
+            echo "❌ 相关工具图更新失败" >> "$LOG_FILE"
+        fi
+        
+        # 重新生成预缓存清单与 Service Worker
+        if /usr/bin/python3 "$PRECACHE_SCRIPT" >> "$LOG_FILE" 2>&1; then
+            echo "✅ 预缓存清单更新成功" >> "$LOG_FILE"
+        else
+            echo "❌ 预缓存清单更新失败" >> "$LOG_FILE"
+        fi
+        
         # 提交变更
-        if ! git diff --quiet HEAD -- navigation_data.json; then
-            git add navigation_data.json
+        if ! git diff --quiet HEAD -- navigation_data.json related_tools.json precache-manifest.json sw.js index.html '*/index.html'; then
+            git add navigation_data.json related_tools.json precache-manifest.json sw.js index.html '*/index.html'
             git commit -m "🤖 Auto-update: 检测到新文件 - $(date +'%H:%M')" || true
         fi
     else
@@ -0,0 +1,341 @@
+// HowManyQ service worker
+// Generated by precache_generator.py - do not edit by hand.
+const CACHE_NAME = 'howmanyq-precache';
+const MANIFEST_VERSION = '0c06bb1bf137';
+const MANIFEST = [
+  {
+    "url": "/",
+    "revision": "858e1efc371860bb",
+    "precache": true
+  },
+  {
+    "url": "/how_many_america_states/",
+    "revision": "56427664c0efbbe7",
+    "precache": false
+  },
+  {
+    "url": "/how_many_calories_in_a_banana/",
+    "revision": "f07477ad6552dd21",
+    "precache": false
+  },
+  {
+    "url": "/how_many_calories_should_i_eat_a_day/",
+    "revision": "06a11144bd572e2d",
+    "precache": false
+  },
+  {
+    "url": "/how_many_chromosomes_do_humans_have/",
+    "revision": "aa4b1383632fad9d",
+    "precache": false
+  },
+  {
+    "url": "/how_many_cm_in_an_inch/",
+    "revision": "0279704c770237ce",
+    "precache": false
+  },
+  {
+    "url": "/how_many_continents_are_there/",
+    "revision": "45f5f9a7b17467e6",
+    "precache": false
+  },
+  {
+    "url": "/how_many_cups_in_a_pint/",
+    "revision": "dfb1b96c63011273",
+    "precache": false
+  },
+  {
+    "url": "/how_many_cups_in_a_quart/",
+    "revision": "3076671c8aef44a2",
+    "precache": true
+  },
+  {
+    "url": "/how_many_days_until_christmas/",
+    "revision": "b7ef6885328cdb73",
+    "precache": true
+  },
+  {
+    "url": "/how_many_days_until_halloween/",
+    "revision": "19bc48ee3ab962ab",
+    "precache": true
+  },
+  {
+    "url": "/how_many_electoral_votes_are_there/",
+    "revision": "ab93792f09029ad0",
+    "precache": false
+  },
+  {
+    "url": "/how_many_feet_in_a_mile/",
+    "revision": "24ac1aa796e74d6d",
+    "precache": false
+  },
+  {
+    "url": "/how_many_grams_in_a_pound/",
+    "revision": "9eb6bd944365ac30",
+    "precache": false
+  },
+  {
+    "url": "/how_many_grams_in_an_ounce/",
+    "revision": "476f6e5179ddf06c",
+    "precache": true
+  },
+  {
+    "url": "/how_many_hours_in_a_week/",
+    "revision": "6c22024cdc7b505f",
+    "precache": false
+  },
+  {
+    "url": "/how_many_hours_in_a_year/",
+    "revision": "cd9a6596e347dd49",
+    "precache": false
+  },
+  {
+    "url": "/how_many_letters_are_in_the_alphabet/",
+    "revision": "f626a1d5b0e79ece",
+    "precache": false
+  },
+  {
+    "url": "/how_many_liters_in_a_gallon/",
+    "revision": "abb6882b89bd10d9",
+    "precache": false
+  },
+  {
+    "url": "/how_many_miles_is_10000_steps/",
+    "revision": "a35cf0d72c935460",
+    "precache": false
+  },
+  {
+    "url": "/how_many_miles_is_a_5k/",
+    "revision": "21b99814355d43a0",
+    "precache": false
+  },
+  {
+    "url": "/how_many_minutes_in_a_day/",
+    "revision": "b616b8b092b50606",
+    "precache": false
+  },
+  {
+    "url": "/how_many_ounces_in_a_cup/",
+    "revision": "7db611f872ee1eca",
+    "precache": false
+  },
+  {
+    "url": "/how_many_ounces_in_a_gallon/",
+    "revision": "fab0da1b9b66031c",
+    "precache": true
+  },
+  {
+    "url": "/how_many_ounces_in_a_pint/",
+    "revision": "787f2cceeb759012",
+    "precache": false
+  },
+  {
+    "url": "/how_many_ounces_in_a_pound/",
+    "revision": "4b663b283ec274bf",
+    "precache": false
+  },
+  {
+    "url": "/how_many_oz_in_a_cup/",
+    "revision": "83e5fe5dd3c6586a",
+    "precache": false
+  },
+  {
+    "url": "/how_many_oz_in_a_gallon/",
+    "revision": "39a7f02f49c5cfcf",
+    "precache": false
+  },
+  {
+    "url": "/how_many_people_are_in_the_world/",
+    "revision": "4c34339ce349515d",
+    "precache": true
+  },
+  {
+    "url": "/how_many_people_are_in_the_world/population-data.json",
+    "revision": "754a96cf64aaac71",
+    "precache": true
+  },
+  {
+    "url": "/how_many_people_live_in_the_us/",
+    "revision": "4a3137ae064f9aa4",
+    "precache": false
+  },
+  {
+    "url": "/how_many_quarts_in_a_gallon/",
+    "revision": "72037f0cbdcf91aa",
+    "precache": false
+  },
+  {
+    "url": "/how_many_seconds_in_a_day/",
+    "revision": "5a60ff461c856eca",
+    "precache": false
+  },
+  {
+    "url": "/how_many_square_feet_in_an_acre/",
+    "revision": "80f27d428e0e5b46",
+    "precache": false
+  },
+  {
+    "url": "/how_many_steps_in_a_mile/",
+    "revision": "da9a1485452dad0c",
+    "precache": false
+  },
+  {
+    "url": "/how_many_tablespoons_in_1/",
+    "revision": "fcaf003ec9f5b2b8",
+    "precache": false
+  },
+  {
+    "url": "/how_many_tablespoons_in_a_cup/",
+    "revision": "a2180f8e63439110",
+    "precache": true
+  },
+  {
+    "url": "/how_many_tbsp_in_a_cup/",
+    "revision": "17f06ed2a56561cd",
+    "precache": false
+  },
+  {
+    "url": "/how_many_teaspoons_in_a_tablespoon/",
+    "revision": "1804434a2bdf2dc1",
+    "precache": false
+  },
+  {
+    "url": "/how_many_weeks_in_a_year/",
+    "revision": "b1aa4ea3cb07ad83",
+    "precache": true
+  },
+  {
+    "url": "/navigation_data.json",
+    "revision": "ef3db11ee6e6be32",
+    "precache": true
+  },
+  {
+    "url": "/share-utils.js",
+    "revision": "4dafd9f37363ff3d",
+    "precache": true
+  }
+];
+
+const REVISIONS = new Map(MANIFEST.map((entry) => [entry.url, entry.revision]));
+
+function normalizePath(pathname) {
+  if (pathname.endsWith('/index.html')) {
+    return pathname.slice(0, -'index.html'.length);
+  }
+  return pathname;
+}
+
+// Entries are stored under a hash-qualified key, so unchanged files survive
+// a deploy and changed files simply miss the cache.
+function cacheKey(path) {
+  return path + '?__rev=' + REVISIONS.get(path);
+}
+
+function fetchFresh(path) {
+  return fetch(new Request(path, { cache: 'no-cache' }));
+}
+
+// Assets are immutable under their hash-qualified key.
+async function cacheFirst(cache, path) {
+  const key = cacheKey(path);
+  const cached = await cache.match(key);
+  if (cached) {
+    return cached;
+  }
+  const response = await fetchFresh(path);
+  if (response.ok) {
+    await cache.put(key, response.clone());
+  }
+  return response;
+}
+
+// Pages always try the network, so an edit shipped without regenerating
+// this file is still seen; the cache only covers offline visits.
+async function networkFirst(cache, path) {
+  const key = cacheKey(path);
+  try {
+    const response = await fetchFresh(path);
+    if (response.ok) {
+      await cache.put(key, response.clone());
+      return response;
+    }
+    return (await cache.match(key)) || response;
+  } catch (error) {
+    const cached = await cache.match(key);
+    if (cached) {
+      return cached;
+    }
+    // Send uncached pages to the homepage rather than serving its body
+    // under another URL, where its relative links would break
+    if (path !== '/' && (await cache.match(cacheKey('/')))) {
+      return Response.redirect('/', 302);
+    }
+    throw error;
+  }
+}
+
+self.addEventListener('install', (event) => {
+  event.waitUntil(
+    caches.open(CACHE_NAME).then((cache) =>
+      Promise.all(
+        MANIFEST.filter((entry) => entry.precache).map(async (entry) => {
+          const key = cacheKey(entry.url);
+          if (await cache.match(key)) {
+            return;
+          }
+          const response = await fetchFresh(entry.url);
+          if (response.ok) {
+            await cache.put(key, response);
+          }
+        })
+      )
+    ).then(() => self.skipWaiting())
+  );
+});
+
+self.addEventListener('activate', (event) => {
+  const currentKeys = new Set(
+    MANIFEST.map((entry) => new URL(cacheKey(entry.url), self.location.origin).href)
+  );
+  event.waitUntil(
+    caches.keys()
+      .then((names) =>
+        Promise.all(
+          names
+            .filter((name) => name.startsWith('howmanyq-') && name !== CACHE_NAME)
+            .map((name) => caches.delete(name))
+        )
+      )
+      .then(() => caches.open(CACHE_NAME))
+      .then((cache) =>
+        cache.keys().then((requests) =>
+          Promise.all(
+            requests
+              .filter((request) => !currentKeys.has(request.url))
+              .map((request) => cache.delete(request))
+          )
+        )
+      )
+      .then(() => self.clients.claim())
+  );
+});
+
+self.addEventListener('fetch', (event) => {
+  const { request } = event;
+  if (request.method !== 'GET') {
+    return;
+  }
+  const url = new URL(request.url);
+  if (url.origin !== self.location.origin) {
+    return;
+  }
+  const path = normalizePath(url.pathname);
+  if (!REVISIONS.has(path)) {
+    return;
+  }
+
+  event.respondWith(
+    caches.open(CACHE_NAME).then((cache) =>
+      request.mode === 'navigate' ? networkFirst(cache, path) : cacheFirst(cache, path)
+    )
+  );
+});